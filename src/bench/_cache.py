@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import secrets
 import sqlite3
+from collections.abc import Collection, Generator, Iterable
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
 from bench import Bench
 from bench._components import Run, to_hash
@@ -13,6 +17,7 @@ from bench.templates import Method, Result, Task, Token
 BENCH_CACHE = ".bench_cache"
 GITIGNORE = ".gitignore"
 TMP = "tmp"
+BATCH_SIZE = 128  # maximum number of IDs per `IN (...)` clause
 
 SQL_INIT = [
     "CREATE TABLE `tasks` (`id` TEXT NOT NULL, `type` TEXT NOT NULL, `data` BLOB NOT NULL, PRIMARY KEY (`id`))",
@@ -31,6 +36,9 @@ class Cache:
         self._methods: dict[str, Method] = {}
         self._runs: dict[str, Run] = {}
         self._tmp_files: list[Path] = []
+        self._transaction_depth = 0
+        # Tasks and methods inserted during the current transaction, to evict from memory on rollback
+        self._transaction_inserts: list[tuple[dict[str, Any], str]] = []
         self._setup()
 
     def _setup(self) -> None:
@@ -70,8 +78,39 @@ class Cache:
             cursor.execute(statement)
         self._db.commit()
 
+    def _commit(self) -> None:
+        """Commit changes to the database, unless a transaction is in progress."""
+        if self._transaction_depth == 0:
+            self._db.commit()
+
     # PUBLIC API
 
+    @contextmanager
+    def transaction(self) -> Generator[None]:
+        """Context manager which commits all changes made inside it at once, when it exits.
+
+        If an exception is raised inside it, all changes made inside it are rolled back instead.
+        Transactions can be nested, in which case only the outermost transaction commits or rolls back.
+        In particular, an exception raised inside a nested transaction which is caught inside the outermost
+        transaction does not roll back any changes.
+        """
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._db.rollback()
+                # Evict the inserted tasks and methods from memory, as they are no longer in the database
+                for objects, object_id in self._transaction_inserts:
+                    objects.pop(object_id, None)
+                self._transaction_inserts.clear()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self._transaction_inserts.clear()
+        self._commit()
+
     def insert_task(self, task: Task) -> None:
         """Insert task into database, if not already."""
         task_id = to_hash(task)
@@ -83,7 +122,9 @@ class Cache:
         task_type = task.type_label()
         task_blob = to_json(task).encode()
         cursor.execute("INSERT INTO `tasks` VALUES (?, ?, ?)", (task_id, task_type, task_blob))
-        self._db.commit()
+        if self._transaction_depth > 0:
+            self._transaction_inserts.append((self._tasks, task_id))
+        self._commit()
 
     def insert_method(self, method: Method) -> None:
         """Insert method into database, if not already."""
@@ -96,7 +137,9 @@ class Cache:
         method_type = method.type_label()
         method_blob = to_json(method).encode()
         cursor.execute("INSERT INTO `methods` VALUES (?, ?, ?)", (method_id, method_type, method_blob))
-        self._db.commit()
+        if self._transaction_depth > 0:
+            self._transaction_inserts.append((self._methods, method_id))
+        self._commit()
 
     def insert_or_update_run(self, run: Run) -> None:
         """Insert run into database, or update it if already in the database."""
@@ -116,7 +159,7 @@ class Cache:
                 "INSERT INTO `runs` VALUES (?, ?, ?, ?, ?, ?)",
                 (run.id, run.task_id, run.method_id, run.status, result_type_name, result_blob),
             )
-        self._db.commit()
+        self._commit()
 
     def select_task(self, task_id: str) -> Task:
         """Get task by id.
@@ -175,6 +218,15 @@ class Cache:
         assert isinstance(result_blob, bytes)
         return self._parse_run(run_id, task_id, method_id, status, result_type_name, result_blob)
 
+    def select_task_ids(self) -> set[str]:
+        """Returns the IDs of all tasks in the database.
+
+        This is much cheaper than :py:meth:`select_tasks`, as no tasks are deserialized.
+        """
+        cursor = self._db.cursor()
+        cursor.execute("SELECT `id` FROM `tasks`")
+        return {task_id for (task_id,) in cursor.fetchall()}
+
     def select_tasks(self) -> list[Task]:
         """Returns a list of all tasks in the database.
 
@@ -218,6 +270,35 @@ class Cache:
             methods.append(method)
         return methods
 
+    def select_methods_by_id(self, method_ids: Collection[str]) -> dict[str, Method]:
+        """Returns a dictionary of the methods with the given IDs.
+
+        Methods that are not cached in memory are fetched from the database in batches, rather than one query
+        per method. IDs for which no method can be found are omitted from the result.
+        For each method that cannot be deserialized properly, an error is logged.
+        """
+        methods = {method_id: self._methods[method_id] for method_id in method_ids if method_id in self._methods}
+        missing_ids = [method_id for method_id in dict.fromkeys(method_ids) if method_id not in methods]
+        cursor = self._db.cursor()
+        for i in range(0, len(missing_ids), BATCH_SIZE):
+            batch_ids = missing_ids[i : i + BATCH_SIZE]
+            placeholders = ",".join(["?" for _ in batch_ids])
+            cursor.execute(f"SELECT `id`, `type`, `data` FROM `methods` WHERE `id` IN ({placeholders})", batch_ids)
+            for method_id, method_type_name, method_blob in cursor.fetchall():
+                assert isinstance(method_id, str)
+                assert isinstance(method_type_name, str)
+                assert isinstance(method_blob, bytes)
+                try:
+                    method = self._parse_method(method_type_name, method_blob)
+                except Exception as err:
+                    msg = (
+                        f"Failed to deserialize method of type '{method_type_name}' ({err}):\n\n{method_blob.decode()}"
+                    )
+                    self._logger.error(msg)
+                    continue
+                self._methods[method_id] = methods[method_id] = method
+        return methods
+
     def select_runs(self, task: Task) -> list[Run]:
         """Returns a list of all runs associated with the given task.
 
@@ -251,15 +332,14 @@ class Cache:
                 runs.append(run)
         return runs
 
-    def delete_runs(self, runs: list[Run]) -> None:
+    def delete_runs(self, runs: Iterable[Run]) -> None:
         """Delete runs from the database."""
         cursor = self._db.cursor()
-        BATCH_SIZE = 128  # delete in batches for efficiency
-        for i in range(0, len(runs), BATCH_SIZE):
-            run_ids = tuple(run.id for run in runs[i : i + BATCH_SIZE])
+        run_ids_iter = (run.id for run in runs)
+        while run_ids := tuple(islice(run_ids_iter, BATCH_SIZE)):
             placeholders = ",".join(["?" for _ in run_ids])
             cursor.execute(f"DELETE FROM `runs` WHERE `id` IN ({placeholders})", run_ids)
-        self._db.commit()
+        self._commit()
 
     # PARSING METHODS
 
@@ -1,8 +1,9 @@
 import hashlib
+import itertools
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from bench._process import Process
 from bench.templates import Method, Result, Task, Token
@@ -14,6 +15,7 @@ class Run:
         self._task_id = task_id
         self._method_id = method_id
         self._result = result
+        self._metrics: dict[str, Any] = {}
 
     @property
     def id(self) -> str:
@@ -34,6 +36,12 @@ class Run:
     @result.setter
     def result(self, result: Result | Token) -> None:
         self._result = result
+        self._metrics.clear()
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Cache of evaluated metrics of the run, keyed by metric name."""
+        return self._metrics
 
     @property
     def status(self) -> Literal["pending", "done", "failed"]:
@@ -46,17 +54,17 @@ class Run:
         raise ValueError(msg)
 
 
-@dataclass
+_EXECUTION_PROCESS_IDS = itertools.count()
+
+
+@dataclass(slots=True)
 class ExecutionProcess:
     process: Process
     task: Task
     method: Method
     num_runs: int
     created_at: datetime
-
-    @property
-    def id(self) -> str:
-        return str(self.created_at)
+    id: int = field(init=False, default_factory=_EXECUTION_PROCESS_IDS.__next__)  # unique, even if created at same time
 
 
 def to_hash(object: Task | Method) -> str:
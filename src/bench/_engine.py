@@ -4,7 +4,7 @@ import importlib.util
 import secrets
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable, cast
+from typing import Iterable
 
 from bench import Bench
 from bench._cache import Cache
@@ -26,7 +26,8 @@ class Engine:
         self._path = path
         self._logger = get_logger("bench")
         self._bench = load_bench(path)
-        self._execution_processes: list[ExecutionProcess] = []
+        # Immutable, such that it can be handed out without copying
+        self._execution_processes: tuple[ExecutionProcess, ...] = ()
 
     @property
     def bench(self) -> Bench:
@@ -43,7 +44,7 @@ class Engine:
     @property
     def execution_processes(self) -> Iterable[ExecutionProcess]:
         """Currently running processes."""
-        return tuple(self._execution_processes)
+        return self._execution_processes
 
     def create_task(self, task_type: type[Task], **kwargs: int | float | str) -> Task:
         """Create task of given type with given arguments.
@@ -104,9 +105,10 @@ class Engine:
             method: Method to apply to task.
             num_runs: Number of runs to execute.
         """
-        # Make sure task and method are in the database
-        self.cache.insert_task(task)
-        self.cache.insert_method(method)
+        # Make sure task and method are in the database (committed together, before the process starts)
+        with self.cache.transaction():
+            self.cache.insert_task(task)
+            self.cache.insert_method(method)
 
         # Create new run(s) with status "pending"
         task_id = to_hash(task)
@@ -117,41 +119,42 @@ class Engine:
             ["bench-run", str(self._path), task_id, method_id, "-n", str(num_runs)],
             path_stdout=self.cache.temporary_file(),
         )
-        self._execution_processes.append(
-            ExecutionProcess(
-                process=process,
-                task=task,
-                method=method,
-                num_runs=num_runs,
-                created_at=datetime.now(),
-            )
+        execution_process = ExecutionProcess(
+            process=process,
+            task=task,
+            method=method,
+            num_runs=num_runs,
+            created_at=datetime.now(),
         )
+        self._execution_processes = (*self._execution_processes, execution_process)
 
     def evaluate_metric(self, metric: Metric[V], run: Run) -> V:
         # Check that run has status 'done'
         if not isinstance(run.result, Result):
             msg = f"Expected run with status 'done', but got {run.status}"
             raise ValueError(msg)
-        # Get task for run
-        task = self.cache.select_task(run.task_id)
-        # Cache metrics in run in private field "_metrics"
-        if not hasattr(run, "_metrics"):
-            setattr(run, "_metrics", {})
-        metrics = cast(dict[str, Any], getattr(run, "_metrics"))
+        # Metrics are cached in the run, so that they are evaluated at most once
+        metrics = run.metrics
         if metric.name in metrics:
             return metrics[metric.name]
+        # Get task for run
+        task = self.cache.select_task(run.task_id)
         # Evaluate metric with run result
         metric_value = metric.evaluate(task, run.result)
         metrics[metric.name] = metric_value
         return metric_value
 
     def delete_runs(self, runs: Iterable[Run]) -> None:
-        self.cache.delete_runs(list(runs))
+        self.cache.delete_runs(runs)
 
     def shutdown(self) -> None:
         self.cache.shutdown()
 
 
+# Benches loaded by `load_bench`, keyed by resolved path and modification time of their module
+_LOADED_BENCHES: dict[tuple[Path, int], Bench] = {}
+
+
 def load_bench(path: Path) -> Bench:
     """Load :py:class:`Bench` instance from the module given by the provided path.
 
@@ -165,6 +168,12 @@ def load_bench(path: Path) -> Bench:
         msg = f"File '{path}' does not exist"
         raise FileNotFoundError(msg)
 
+    # Reuse the `Bench` instance if the module was loaded before and has not been modified since
+    # Note that the module is not registered in `sys.modules`, as its name might shadow another module
+    key = (path.resolve(), path.stat().st_mtime_ns)
+    if (bench := _LOADED_BENCHES.get(key)) is not None:
+        return bench
+
     # Load module
     module_name = path.stem
     spec = importlib.util.spec_from_file_location(module_name, path)
@@ -177,8 +186,9 @@ def load_bench(path: Path) -> Bench:
     spec.loader.exec_module(module)
 
     # Find `Bench` instance
-    for _, object in vars(module).items():
+    for object in vars(module).values():
         if isinstance(object, Bench):
+            _LOADED_BENCHES[key] = object
             return object
 
     msg = f"Python module '{path}' contains no instance of `Bench`"
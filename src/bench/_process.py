@@ -1,3 +1,4 @@
+import codecs
 import subprocess
 from pathlib import Path
 
@@ -16,23 +17,34 @@ class Process:
         # Keep track of status and stdout
         self._status: int | None = None
         self._stdout = ""
+        # Read the temporary file incrementally, only decoding what was written since the previous poll
+        # The file is read unbuffered, as every read consumes all new bytes anyway
+        self._file_read = self._path_stdout.open("rb", buffering=0)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
     @property
     def stdout(self) -> str:
         return self._stdout
 
+    def read_stdout(self, offset: int) -> str:
+        """Returns the stdout of the process starting at the given offset."""
+        return self._stdout[offset:]
+
     def poll(self) -> int | None:
         # If process was already closed, return the status
         if self._status is not None:
             return self._status
-        # Update `self._stdout` with contents of the temporary file
-        with self._path_stdout.open("r") as file:
-            self._stdout = file.read()
-        # Poll the status of the process
-        self._status = self._process.poll()
+        # Poll the status of the process before reading, such that no output is missed when it just closed
+        status = self._process.poll()
+        # Update `self._stdout` with the new contents of the temporary file (if any)
+        data = self._file_read.read()
+        if data or status is not None:
+            self._stdout += self._decoder.decode(data, final=status is not None)
         # If process just closed, also close the temporary file
-        if self._status is not None:
+        if status is not None:
             self._file_stdout.close()
+            self._file_read.close()
+        self._status = status
         return self._status
 
     def kill(self) -> None:
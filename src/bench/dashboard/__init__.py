@@ -12,6 +12,13 @@ from bench._engine import Engine
 from bench.dashboard.components import Menu, PageNewTask
 
 PATH_ASSETS = Path(cast(str, bench.__file__)).resolve().parent / "assets"
+CONTENT_STYLE = {
+    "flex-grow": "1",
+    "padding": "8px 8px 8px 8px",
+    "max-height": "100dvh",
+    "overflow-y": "auto",
+    "box-sizing": "border-box",
+}
 
 
 class Dashboard:
@@ -31,15 +38,7 @@ class Dashboard:
         session.set_favicon(PATH_ASSETS / "favicon.png")
 
         # Create content and menu
-        content_elem = Div().style(
-            {
-                "flex-grow": "1",
-                "padding": "8px 8px 8px 8px",
-                "max-height": "100dvh",
-                "overflow-y": "auto",
-                "box-sizing": "border-box",
-            }
-        )
+        content_elem = Div().style(CONTENT_STYLE)
 
         content = Signal[Elem](Div())
         Effect(lambda: content_elem.clear().append(content()))
@@ -1,8 +1,9 @@
 import re
+from functools import cache
 from typing import Any
 
-_ANSI2HTML_STYLES: dict[str, Any] = {}
-_ANSI_PATTERN = re.compile("(?:\033\\[(\d+(?:;\d+)*)?([cnRhlABCDfsurgKJipm]))")
+_ANSI_PATTERN = re.compile(r"(?:\033\[(\d+(?:;\d+)*)?([cnRhlABCDfsurgKJipm]))")
+_ANSI_INCOMPLETE_PATTERN = re.compile(r"\033(?:\[[\d;]*)?\Z")
 _ANSI2HTML_PALETTE = [
     "var(--text-muted)",
     "var(--red)",
@@ -23,10 +24,8 @@ _ANSI2HTML_PALETTE = [
 ]
 
 
+@cache
 def _ansi2html_get_style():
-    if "style" in _ANSI2HTML_STYLES:
-        return _ANSI2HTML_STYLES["style"]
-
     p = _ANSI2HTML_PALETTE
 
     regular_style = {
@@ -64,72 +63,115 @@ def _ansi2html_get_style():
         lll = g * 10 + 8
         indexed_style["%s" % i] = "".join(f"{c:02X}" if 0 <= c <= 255 else "" for c in (lll, lll, lll))
 
-    _ANSI2HTML_STYLES["style"] = (regular_style, bold_style, indexed_style)
-    return _ANSI2HTML_STYLES["style"]
+    return regular_style, bold_style, indexed_style
 
 
-def ansi2html(text: str) -> str:
-    def _ansi2html(m: re.Match):
-        if m.group(2) != "m":
+class AnsiConverter:
+    """Converts text with ANSI escape sequences to HTML.
+
+    The converter keeps track of the styles that are active at the end of the converted text, such that
+    text which arrives in chunks (e.g. the output of a running process) can be converted one chunk at a time.
+    Styles that are still active are closed at the end of each chunk and re-opened at the start of the next
+    chunk, so that the HTML of every chunk is well-formed by itself. An escape sequence that is cut off at the
+    end of a chunk is held back until the next chunk arrives, or until :py:meth:`flush` is called.
+    """
+
+    def __init__(self) -> None:
+        self._stack: list[Any] = []
+        self._tags: list[str] = []
+        self._pending = ""
+
+    def convert(self, text: str) -> str:
+        """Convert the next chunk of text to HTML."""
+        text = self._pending + text
+        if m := _ANSI_INCOMPLETE_PATTERN.search(text):
+            text, self._pending = text[: m.start()], text[m.start() :]
+        else:
+            self._pending = ""
+        return self._convert(text)
+
+    def flush(self) -> str:
+        """Convert the text that is held back, once no more chunks will arrive."""
+        text, self._pending = self._pending, ""
+        return self._convert(text)
+
+    def _convert(self, text: str) -> str:
+        if not text:
             return ""
-        state = None
-        sub = ""
-        cs = m.group(1)
-        cs = cs.strip() if cs else ""
-        for c in cs.split(";"):
-            c = c.strip().lstrip("0") or "0"
-            if c == "0":
-                while stack:
-                    sub += "</span>"
-                    stack.pop()
-            elif c in ("38", "48"):
-                extra = [c]
-                state = "extra"
-            elif state == "extra":
-                if c == "5":
-                    state = "idx"
-                elif c == "2":
-                    state = "r"
-            elif state:
-                if state == "idx":
-                    extra.append(c)
-                    state = None
-                    # 256 colors
-                    color = indexed_style.get(c)  # TODO: convert index to RGB!
-                    if color is not None:
-                        sub += '<span style="%s:%s">' % ("color" if extra[0] == "38" else "background-color", color)
-                        stack.append(extra)
-                elif state in ("r", "g", "b"):
-                    extra.append(c)
-                    if state == "r":
-                        state = "g"
-                    elif state == "g":
-                        state = "b"
-                    else:
+        regular_style, bold_style, indexed_style = _ansi2html_get_style()
+        stack = self._stack
+        tags = self._tags
+
+        def push(entry: Any, tag: str) -> str:
+            stack.append(entry)
+            tags.append(tag)
+            return tag
+
+        def _ansi2html(m: re.Match):
+            if m.group(2) != "m":
+                return ""
+            state = None
+            sub = ""
+            cs = m.group(1)
+            cs = cs.strip() if cs else ""
+            for c in cs.split(";"):
+                c = c.strip().lstrip("0") or "0"
+                if c == "0":
+                    while stack:
+                        sub += "</span>"
+                        stack.pop()
+                        tags.pop()
+                elif c in ("38", "48"):
+                    extra = [c]
+                    state = "extra"
+                elif state == "extra":
+                    if c == "5":
+                        state = "idx"
+                    elif c == "2":
+                        state = "r"
+                elif state:
+                    if state == "idx":
+                        extra.append(c)
                         state = None
-                        try:
-                            color = "#" + "".join("%02X" % c if 0 <= c <= 255 else "" for x in extra for c in [int(x)])
-                        except (ValueError, TypeError):
-                            pass
+                        # 256 colors
+                        color = indexed_style.get(c)  # TODO: convert index to RGB!
+                        if color is not None:
+                            attr = "color" if extra[0] == "38" else "background-color"
+                            sub += push(extra, '<span style="%s:%s">' % (attr, color))
+                    elif state in ("r", "g", "b"):
+                        extra.append(c)
+                        if state == "r":
+                            state = "g"
+                        elif state == "g":
+                            state = "b"
                         else:
-                            sub += '<span style="%s:%s">' % ("color" if extra[0] == "38" else "background-color", color)
-                            stack.append(extra)
-            else:
-                if "1" in stack:
-                    style = bold_style.get(c)
+                            state = None
+                            try:
+                                color = "#" + "".join(
+                                    "%02X" % c if 0 <= c <= 255 else "" for x in extra for c in [int(x)]
+                                )
+                            except (ValueError, TypeError):
+                                pass
+                            else:
+                                attr = "color" if extra[0] == "38" else "background-color"
+                                sub += push(extra, '<span style="%s:%s">' % (attr, color))
                 else:
-                    style = regular_style.get(c)
-                if style is not None:
-                    sub += '<span style="%s">' % style
-                    stack.append(c)
-                    # Still needs to be added to the stack even if style is empty
-                    # (so it can check '1' in stack above, for example)
-        return sub
-
-    stack: list[Any] = []
-    regular_style, bold_style, indexed_style = _ansi2html_get_style()
-    sub = _ANSI_PATTERN.sub(_ansi2html, text)
-    while stack:
-        sub += "</span>"
-        stack.pop()
-    return sub
+                    if "1" in stack:
+                        style = bold_style.get(c)
+                    else:
+                        style = regular_style.get(c)
+                    if style is not None:
+                        sub += push(c, '<span style="%s">' % style)
+                        # Still needs to be added to the stack even if style is empty
+                        # (so it can check '1' in stack above, for example)
+            return sub
+
+        # Re-open the styles that were active at the end of the previous chunk
+        html = "".join(tags) + _ANSI_PATTERN.sub(_ansi2html, text)
+        # Close the styles that are still active
+        return html + "</span>" * len(stack)
+
+
+def ansi2html(text: str) -> str:
+    converter = AnsiConverter()
+    return converter.convert(text) + converter.flush()
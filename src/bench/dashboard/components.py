@@ -1,34 +1,38 @@
 from __future__ import annotations
 
 import json
-from collections import defaultdict
 from collections.abc import Collection
 from datetime import timedelta
 from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-import numpy as np
 from slash.basic import Axes, Checkbox, Icon, Tooltip, confirm
 from slash.basic import DataTable as SlashDataTable
 from slash.basic import FillBetween as SlashFillBetween
 from slash.basic import Graph as SlashGraph
 from slash.basic import Plot as SlashPlot
 from slash.core import Children, Elem, Session
-from slash.events import ClickEvent
 from slash.html import H3, HTML, Button, Code, Details, Dialog, Div, Input, Option, P, Pre, Select, Span, Summary
 from slash.layout import Column, Panel, Row
 from slash.reactive import Effect, Signal
 
 from bench._cache import BENCH_CACHE
+from bench._components import to_hash
 from bench._engine import Engine, ExecutionProcess, Run
 from bench._logging import get_logger
-from bench.dashboard._ansi import ansi2html
-from bench.dashboard.utils import RunGroup, Timer, download_file, get_color, timedelta_to_str
+from bench.dashboard._ansi import AnsiConverter
+from bench.dashboard.utils import Debounce, RunGroup, Ticker, download_file, get_color, timedelta_to_str
 from bench.metrics import Graph, Metric, Table, Time
 from bench.templates import Param, Task
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _LOGGER = get_logger("bench")
+# Delay for coalescing rapid clicks: short enough to not be noticed, long enough to absorb a burst of clicks
+DEBOUNCE_SECONDS = 0.05
 
 FORM_STYLE = {
     "display": "grid",
@@ -37,6 +41,96 @@ FORM_STYLE = {
     "gap": "8px",
     "min-width": "384px",
 }
+FORM_LABEL_STYLE = {"align-items": "center", "gap": "4px"}
+FORM_HELP_ICON_STYLE = {"color": "var(--gray)", "--icon-size": "20px"}
+TASK_TYPES_STYLE = {
+    "display": "grid",
+    "grid-template-columns": "repeat(2, max-content)",
+    "align-items": "center",
+    "gap": "8px 16px",
+}
+MENU_STYLE = {
+    "width": "224px",
+    "height": "calc(100dvh - 16px)",
+    "margin": "8px",
+    "padding": "8px",
+    "border-radius": "8px",
+    "box-sizing": "border-box",
+    "background-color": "var(--bg)",
+    "box-shadow": "var(--shadow)",
+    "border": "1px solid var(--border-muted)",
+}
+MENU_HEADER_STYLE = {
+    "display": "flex",
+    "align-items": "center",
+    "gap": "8px",
+    "height": "40px",
+    "line-height": "40px",
+    "padding": "0px 8px",
+    "font-weight": "bold",
+}
+MENU_ITEM_STYLE = {
+    "display": "flex",
+    "align-items": "center",
+    "gap": "8px",
+    "height": "40px",
+    "padding": "0px 8px",
+    "cursor": "pointer",
+}
+MENU_TASKS_HEADER_STYLE = {"justify-content": "space-between", "padding-right": "0px"}
+MENU_PROCESS_LABEL_STYLE = {"font-size": "12px"}
+MENU_SEPARATOR_STYLE = {"height": "0px", "border-bottom": "1px solid var(--border)", "margin": "8px"}
+THEME_BUTTONS_STYLE = {"margin": "auto 0px 8px 0px", "justify-content": "center", "gap": "32px"}
+THEME_BUTTON_STYLE = {"cursor": "pointer", "opacity": "0.33", "align-items": "center", "gap": "6px"}
+ACTION_BUTTON_STYLE = {
+    "min-width": "inherit",
+    "width": "36px",
+    "height": "36px",
+    "padding": "0px",
+    "display": "flex",
+    "justify-content": "center",
+    "align-items": "center",
+}
+ACTION_ICON_STYLE = {"opacity": "0.8", "--icon-size": "20px"}
+ACTION_ROW_STYLE = {"align-items": "center", "gap": "16px"}
+DIALOG_BUTTONS_STYLE = {"justify-content": "center", "gap": "16px", "margin-top": "16px"}
+DIALOG_SEPARATOR_STYLE = {"background-color": "var(--border-muted)", "height": "1px", "margin": "16px 0px"}
+BOLD_STYLE = {"font-weight": "bold"}
+PROCESS_INFO_STYLE = {
+    "display": "grid",
+    "grid-template-columns": "repeat(2, max-content)",
+    "grid-gap": "8px 16px",
+    "margin-bottom": "16px",
+    "align-items": "start",
+}
+STDOUT_STYLE = {"padding": "16px"}
+STDOUT_CHUNK_STYLE = {"display": "inline"}  # such that a line written across chunks is not broken up
+PROCESS_STATUSES = {
+    "running": ("Running..", {"font-style": "italic"}),
+    "done": ("Done", {"font-weight": "bold", "color": "var(--green)"}),
+    "failed": ("Failed", {"font-weight": "bold", "color": "var(--red)"}),
+}
+METRIC_HIDDEN_STYLE = {"padding": "16px", "display": "none"}
+TIME_STYLE = {"padding": "16px", "display": None}
+TIME_GRID_STYLE = {
+    "display": "grid",
+    "grid-gap": "8px 16px",
+    "align-items": "center",
+    "justify-content": "space-around",
+    "justify-items": "center",
+}
+TIME_KEY_STYLE = {"font-style": "italic"}
+GRAPH_STYLE = {"display": "flex", "flex-direction": "column", "align-items": "center"}
+GRAPH_SHOWN_STYLE = {"padding": "16px", "display": "flex"}
+GRAPH_OPTIONS_STYLE = {"gap": "32px"}
+METRICS_STYLE = {"display": "flex", "gap": "16px", "flex-wrap": "wrap", "align-items": "flex-start"}
+TABLE_BADGE_STYLE = {"border": "1px solid #0005"}
+CONFIRM_DELETE_STYLE = {"gap": "12px"}
+CONFIRM_DELETE_GROUPS_STYLE = {"gap": "12px", "padding": "8px"}
+GROUP_CIRCLE_STYLE = {"width": "24px", "height": "24px", "border-radius": "12px"}
+GROUP_LABEL_STYLE = {"color": "var(--white)", "padding": "3px 6px", "border-radius": "4px"}
+GROUP_RUNS_STYLE = {"color": "var(--gray)"}
+GROUP_DESCRIPTION_STYLE = {"color": "var(--gray)", "font-size": "12px"}
 
 
 class Menu(Column):
@@ -51,149 +145,123 @@ class Menu(Column):
         super().__init__()
         self._engine = engine
         self._content = content
+        self._task_ids = self._engine.cache.select_task_ids()
         self._tasks = Signal(self._engine.cache.select_tasks())
         self._processes = Signal(self._engine.execution_processes)
+        self._ticker = Ticker(seconds=1.0)
+        self._task_pages: dict[str, PageTask] = {}
+        self._process_pages: dict[int, PageProcess] = {}
         self._setup()
 
     def _setup(self) -> None:
         # Style
-        self.style(
-            {
-                "width": "224px",
-                "height": "calc(100dvh - 16px)",
-                "margin": "8px",
-                "padding": "8px",
-                "border-radius": "8px",
-                "box-sizing": "border-box",
-                "background-color": "var(--bg)",
-                "box-shadow": "var(--shadow)",
-                "border": "1px solid var(--border-muted)",
-            }
-        )
+        self.style(MENU_STYLE)
         # Tasks
         self.append(
             self._header(
                 "Tasks",
                 action_button("+").onclick(lambda: self._content.set(PageNewTask(self._engine, self))),
-            ).style({"justify-content": "space-between", "padding-right": "0px"}),
+            ).style(MENU_TASKS_HEADER_STYLE),
             self._tasks_column(),
         )
         # Processes
         self.append(self._processes_column())
         # Theme
         self.append(self._theme_buttons())
-        # Timer
-        self.append(Timer(self.refresh, seconds=1.0, repeat=True))
+        # Ticker, which is also used by the processes column and by process pages
+        self._ticker.subscribe(self.refresh)
+        self.append(self._ticker)
 
     def _header(self, *children: Children) -> Elem:
-        return Div(*children).style(
-            {
-                "display": "flex",
-                "align-items": "center",
-                "gap": "8px",
-                "height": "40px",
-                "line-height": "40px",
-                "padding": "0px 8px",
-                "font-weight": "bold",
-            }
-        )
+        return Div(*children).style(MENU_HEADER_STYLE)
 
     def _item(self, *children: Children, onclick: Callable[[], Awaitable[Any] | Any] | None = None) -> Elem:
-        item = Div(*children).style(
-            {
-                "display": "flex",
-                "align-items": "center",
-                "gap": "8px",
-                "height": "40px",
-                "padding": "0px 8px",
-                "cursor": "pointer",
-            }
-        )
+        item = Div(*children).style(MENU_ITEM_STYLE)
         if onclick is not None:
-            item.onclick(lambda: onclick())
+            item.onclick(onclick)
         return item
 
     def _separator(self) -> Elem:
-        return Div().style({"height": "0px", "border-bottom": "1px solid var(--border)", "margin": "8px"})
+        return Div().style(MENU_SEPARATOR_STYLE)
 
     def _theme_buttons(self) -> Elem:
         return Row(
-            Row(Icon("sun"), "light")
-            .style({"cursor": "pointer", "opacity": "0.33", "align-items": "center", "gap": "6px"})
-            .onclick(lambda: Session.require().set_theme("light")),
-            Row(Icon("moon"), "dark")
-            .style({"cursor": "pointer", "opacity": "0.33", "align-items": "center", "gap": "6px"})
-            .onclick(lambda: Session.require().set_theme("dark")),
-        ).style({"margin": "auto 0px 8px 0px", "justify-content": "center", "gap": "32px"})
+            Row(Icon("sun"), "light").style(THEME_BUTTON_STYLE).onclick(lambda: Session.require().set_theme("light")),
+            Row(Icon("moon"), "dark").style(THEME_BUTTON_STYLE).onclick(lambda: Session.require().set_theme("dark")),
+        ).style(THEME_BUTTONS_STYLE)
 
     def _click_task(self, task: Task) -> None:
-        self._content.set(PageTask(self._engine, task))
+        # Pages are created once per task, and refresh their runs whenever they are shown again
+        # Note that the page is not mounted again when it is already shown, so it is refreshed explicitly
+        task_id = to_hash(task)
+        if (page := self._task_pages.get(task_id)) is None:
+            page = self._task_pages[task_id] = PageTask(self._engine, task)
+        else:
+            page.refresh_runs()
+        self._content.set(page)
 
     def _click_process(self, execution: ExecutionProcess) -> None:
-        self._content.set(PageProcess(self._engine, execution))
+        # Pages are created once per execution, and resume polling whenever they are shown again
+        if (page := self._process_pages.get(execution.id)) is None:
+            page = self._process_pages[execution.id] = PageProcess(self._engine, execution, self._ticker)
+        self._content.set(page)
 
     def _tasks_column(self) -> Elem:
         column = Column()
 
         def set_column() -> None:
             column.clear()
-            for task in self._tasks():
-                column.append(self._item(task.label(), onclick=lambda t=task: self._click_task(t)))
+            column.append([self._item(task.label(), onclick=partial(self._click_task, task)) for task in self._tasks()])
 
         Effect(set_column)
         return column
 
     def _processes_column(self) -> Elem:
         column = Column()
+        # Rows are created once per execution and kept across refreshes (the engine never removes executions)
+        statuses: dict[int, Signal[int | None]] = {}
+        running: dict[int, ExecutionProcess] = {}
 
         def set_column() -> None:
-            column.clear()
-
             executions = self._processes()
-            if executions:
+            if executions and not statuses:
                 column.append(self._header("Processes"))
-
-            statuses: dict[str, Signal[int | None]] = {}
             for execution in executions:
-                # Reactive icon
-                icon = Icon("")
-                status = Signal(execution.process.poll())
-                Effect(lambda: icon.set_icon(self.icon_status(status())))
-                statuses[execution.id] = status
-
-                def handle_click(event: ClickEvent, execution: ExecutionProcess) -> None:
-                    self._click_process(execution)
-
-                column.append(
-                    Div(
-                        icon,
-                        Column(
-                            Span(execution.task.label()),
-                            Span(execution.method.label()),
-                        ).style({"font-size": "12px"}),
-                    )
-                    .style(
-                        {
-                            "display": "flex",
-                            "align-items": "center",
-                            "gap": "8px",
-                            "height": "40px",
-                            "padding": "0px 8px",
-                            "cursor": "pointer",
-                        }
-                    )
-                    .onclick(partial(handle_click, execution=execution))
-                )
-
-            def refresh_statuses() -> None:
-                for execution in self._processes():
-                    statuses[execution.id].set(execution.process.poll())
-
-            column.append(Timer(refresh_statuses, seconds=1.0, repeat=True))
+                if execution.id in statuses:
+                    continue
+                statuses[execution.id] = status = Signal(code := execution.process.poll())
+                if code is None:
+                    running[execution.id] = execution
+                column.append(self._process_item(execution, status))
+            # Poll the statuses of running processes, until all of them have exited
+            if running:
+                self._ticker.subscribe(refresh_statuses)
+
+        def refresh_statuses() -> None:
+            for execution in list(running.values()):
+                # The status of a running process is `None`, so only update it once the process has exited
+                if (code := execution.process.poll()) is not None:
+                    statuses[execution.id].set(code)
+                    del running[execution.id]
+            if not running:
+                self._ticker.unsubscribe(refresh_statuses)
 
         Effect(set_column)
         return column
 
+    def _process_item(self, execution: ExecutionProcess, status: Signal[int | None]) -> Elem:
+        # Reactive icon
+        icon = Icon("")
+        Effect(lambda: icon.set_icon(self.icon_status(status())))
+        return self._item(
+            icon,
+            Column(
+                Span(execution.task.label()),
+                Span(execution.method.label()),
+            ).style(MENU_PROCESS_LABEL_STYLE),
+            onclick=partial(self._click_process, execution),
+        )
+
     def icon_status(self, status: int | None) -> str:
         if status is None:
             return "loading"
@@ -203,8 +271,16 @@ class Menu(Column):
             return "error"
 
     def refresh(self) -> None:
-        self._tasks.set(self._engine.cache.select_tasks())
-        self._processes.set(self._engine.execution_processes)
+        # Only load the tasks (and trigger the tasks column) when tasks were added or removed
+        task_ids = self._engine.cache.select_task_ids()
+        if task_ids != self._task_ids:
+            self._task_ids = task_ids
+            self._tasks.set(self._engine.cache.select_tasks())
+        # Only trigger the processes column when there are new executions
+        # (the engine replaces its tuple of executions whenever one is added)
+        executions = self._engine.execution_processes
+        if executions is not self._processes():
+            self._processes.set(executions)
 
 
 class PageNewTask(Div):
@@ -221,21 +297,14 @@ class PageNewTask(Div):
             H3("Create new task"),
             P("Create a new task from one of the following types of tasks."),
             Div(
-                *[
-                    [
-                        Button(task_type.type_label()).onclick(lambda _, t=task_type: self._create_task(t)),
+                *chain.from_iterable(
+                    (
+                        Button(task_type.type_label()).onclick(partial(self._create_task, task_type)),
                         Span(task_type.type_description()),
-                    ]
+                    )
                     for task_type in self._engine.bench.task_types
-                ]
-            ).style(
-                {
-                    "display": "grid",
-                    "grid-template-columns": "repeat(2, max-content)",
-                    "align-items": "center",
-                    "gap": "8px 16px",
-                }
-            ),
+                )
+            ).style(TASK_TYPES_STYLE),
         )
         self._dialog_new_task: DialogNewTask | None = None
 
@@ -260,7 +329,7 @@ class DialogNewTask(Dialog):
             Row(
                 Button("Create").onclick(self._handle_click_create),
                 Button("Cancel").onclick(lambda: self.close()),
-            ).style({"justify-content": "center", "gap": "16px", "margin-top": "16px"}),
+            ).style(DIALOG_BUTTONS_STYLE),
         )
         self._form = form
 
@@ -289,10 +358,11 @@ class DialogNewTask(Dialog):
 class PageProcess(Div):
     """Page element for seeing the progress of a process."""
 
-    def __init__(self, engine: Engine, execution: ExecutionProcess) -> None:
+    def __init__(self, engine: Engine, execution: ExecutionProcess, ticker: Ticker) -> None:
         super().__init__()
         self._engine = engine
         self._execution = execution
+        self._ticker = ticker
         self._setup()
 
     def _setup(self) -> None:
@@ -302,55 +372,69 @@ class PageProcess(Div):
         created_at = self._execution.created_at
 
         status = Signal(process.poll())
-        stdout = Signal(process.stdout)
 
-        stdout_html = HTML("")
-        Effect(lambda: stdout_html.set_html(ansi2html(stdout())))
+        # Only read and convert the output that was written since the previous update,
+        # and append it as a new chunk of HTML, so that earlier output is not sent again
+        ansi_converter = AnsiConverter()
+        self._stdout_length = 0
+
+        def update_stdout() -> None:
+            html = ""
+            if text := process.read_stdout(self._stdout_length):
+                self._stdout_length += len(text)
+                html = ansi_converter.convert(text)
+            # Once the process has exited, no more output follows, so also convert the text that was held back
+            if status() is not None:
+                html += ansi_converter.flush()
+            if html:
+                stdout_code.append(HTML(html).style(STDOUT_CHUNK_STYLE))
+
+        stdout_code = Code().style(STDOUT_STYLE)
+        update_stdout()
 
         status_span = Span()
         Effect(lambda: status_span.clear().append(self._process_status(status())))
 
-        def timer_callback() -> None:
+        def tick() -> None:
+            # Stop polling once the page is closed or the process has exited
+            if not self.is_mounted():
+                self._ticker.unsubscribe(tick)
+                return
+
             status.set(process.poll())
-            stdout.set(process.stdout)
+            update_stdout()
 
             if status() is not None:
-                timer.unmount()
+                self._ticker.unsubscribe(tick)
+
+        def subscribe() -> None:
+            if status() is None:
+                self._ticker.subscribe(tick)
 
-        timer = Timer(timer_callback, 1.0, repeat=True)
+        subscribe()
+        self.onmount(subscribe)
 
         self.clear()
         self.append(
             Row(
                 H3("Process information"),
-                button_cancel := action_button(Icon("cancel").style({"opacity": "0.8", "--icon-size": "20px"})).onclick(
-                    self._cancel_process
-                ),
+                button_cancel := action_button(Icon("cancel").style(ACTION_ICON_STYLE)).onclick(self._cancel_process),
                 Tooltip("Cancel process", target=button_cancel),
-            ).style({"gap": "16px", "align-items": "center"}),
+            ).style(ACTION_ROW_STYLE),
             Div(
-                Span("Task").style({"font-weight": "bold"}),
+                Span("Task").style(BOLD_STYLE),
                 Span(task.label()),
-                Span("Method").style({"font-weight": "bold"}),
+                Span("Method").style(BOLD_STYLE),
                 Span(method.label()),
-                Span("Created at").style({"font-weight": "bold"}),
+                Span("Created at").style(BOLD_STYLE),
                 Span(created_at.strftime("%B %d, %Y, %H:%M:%S")),
-                Span("Status").style({"font-weight": "bold"}),
+                Span("Status").style(BOLD_STYLE),
                 status_span,
-            ).style(
-                {
-                    "display": "grid",
-                    "grid-template-columns": "repeat(2, max-content)",
-                    "grid-gap": "8px 16px",
-                    "margin-bottom": "16px",
-                    "align-items": "start",
-                }
-            ),
+            ).style(PROCESS_INFO_STYLE),
             Div(
                 Details(
-                    Summary("Output").style({"font-weight": "bold"}),
-                    Pre(Code(stdout_html).style({"padding": "16px"})),
-                    timer,
+                    Summary("Output").style(BOLD_STYLE),
+                    Pre(stdout_code),
                 ).set_attr("open", "")
             ),
         )
@@ -358,12 +442,8 @@ class PageProcess(Div):
         Effect(lambda: button_cancel.set_disabled(status() is not None))
 
     def _process_status(self, status: int | None) -> Elem:
-        if status is None:
-            return Span("Running..").style({"font-style": "italic"})
-        if status == 0:
-            return Span("Done").style({"font-weight": "bold", "color": "var(--green)"})
-        else:
-            return Span("Failed").style({"font-weight": "bold", "color": "var(--red)"})
+        text, style = PROCESS_STATUSES["running" if status is None else "done" if status == 0 else "failed"]
+        return Span(text).style(style)
 
     async def _cancel_process(self) -> None:
         if await confirm("Are you sure you want to cancel this process?"):
@@ -378,6 +458,9 @@ class PageTask(Div):
         self._engine = engine
         self._task = task
         self._groups: dict[str, RunGroup] = {}
+        self._checkboxes: dict[str, tuple[Checkbox, Span, int]] = {}
+        self._runs_signature: tuple[tuple[str, str], ...] | None = None
+        self._selected_method_ids: set[str] = set()
         self._selected_groups = Signal[list[RunGroup]]([])
         self._setup()
 
@@ -397,17 +480,20 @@ class PageTask(Div):
                 ).onclick(lambda: dialog_new_run.show_modal()),
                 Tooltip("New run", target=button_new_run),
                 button_refresh := action_button(
-                    Icon("refresh").style({"opacity": "0.8", "--icon-size": "20px"}),
-                ).onclick(self._refresh_runs),
+                    Icon("refresh").style(ACTION_ICON_STYLE),
+                ).onclick(self.refresh_runs),
                 Tooltip("Refresh", target=button_refresh),
                 button_delete := action_button(
-                    Icon("trash").style({"opacity": "0.8", "--icon-size": "20px"}),
+                    Icon("trash").style(ACTION_ICON_STYLE),
                 ).onclick(self._delete_selected_runs),
                 Tooltip("Delete selected runs", target=button_delete),
-            ).style({"align-items": "center", "gap": "16px"})
+            ).style(ACTION_ROW_STYLE)
         )
         # Disable delete button when no groups are selected
         Effect(lambda: button_delete.set_disabled(not self._selected_groups()))
+        # Coalesce rapid checkbox clicks into a single update of the selected groups
+        self._debounce_selection = Debounce(self._update_selected_groups, seconds=DEBOUNCE_SECONDS)
+        self.append(self._debounce_selection)
         # Checkboxes
         self._column_checkboxes = Column()
         self.append(self._column_checkboxes)
@@ -415,78 +501,108 @@ class PageTask(Div):
         self.append(
             header_metrics := Row(
                 H3("Metrics"),
-                button_download_metrics := action_button(
-                    Icon("download").style({"opacity": "0.8", "--icon-size": "20px"})
-                ).onclick(self._download_metrics),
+                button_download_metrics := action_button(Icon("download").style(ACTION_ICON_STYLE)).onclick(
+                    self._download_metrics
+                ),
                 Tooltip("Download metrics as JSON", target=button_download_metrics),
-            ).style({"align-items": "center", "gap": "16px"}),
+            ).style(ACTION_ROW_STYLE),
             Div(
                 [
                     create_metric_elem(self._engine, metric, self._selected_groups)
                     for metric in self._task.type_metrics()
                 ]
-            ).style(
-                {"display": "flex", "gap": "16px", "flex-wrap": "wrap", "align-items": "flex-start"},
-            ),
+            ).style(METRICS_STYLE),
         )
         Effect(lambda: header_metrics.style({"display": None if self._selected_groups() else "none"}))
-        # Refresh runs
-        self._refresh_runs()
+        # Refresh runs, also whenever the page is shown again
+        self.refresh_runs()
+        self.onmount(self.refresh_runs)
+
+    def refresh_runs(self) -> None:
+        runs = self._engine.cache.select_runs(self._task)
+        # Nothing to do if no runs were added or removed, and no run changed status
+        # Note that the groups then keep the current runs, including the metrics cached in them
+        runs_signature = tuple((run.id, run.status) for run in runs)
+        if runs_signature == self._runs_signature:
+            return
+        self._runs_signature = runs_signature
 
-    def _refresh_runs(self) -> None:
         # Re-fill groups with all runs belonging to task
         # Create new groups for new methods
-        runs = self._engine.cache.select_runs(self._task)
         for group in self._groups.values():
             group.runs = []
+            group.runs_done = []
         for run in runs:
-            if run.method_id not in self._groups:
-                self._groups[run.method_id] = RunGroup(
+            if (group := self._groups.get(run.method_id)) is None:
+                group = self._groups[run.method_id] = RunGroup(
                     method_id=run.method_id, runs=[], color=get_color(len(self._groups))
                 )
-            self._groups[run.method_id].runs.append(run)
+            group.runs.append(run)
+            if run.status == "done":
+                group.runs_done.append(run)
 
-        # TODO: Find a better way of detecting if changes were made. Note that this must include
-        # (1) new runs, (2) removed runs, (3) run changed status, (4) more ?
-        changes = True
-
-        if changes:
-            self._update_checkboxes()
-            self._selected_groups.trigger()  # FIXME: Any way to circumvent this?
+        # Fetch the methods of all groups in a single query, such that `group_badge` finds them in the cache
+        self._engine.cache.select_methods_by_id(self._groups)
+        self._update_checkboxes()
+        self._selected_groups.trigger()  # FIXME: Any way to circumvent this?
 
     def _update_checkboxes(self) -> None:
-        self._column_checkboxes.clear()
-        checkboxes: list[Checkbox] = []
-
-        def handle_click_checkbox() -> None:
-            self._selected_groups.set([group for group, cb in zip(self._groups.values(), checkboxes) if cb.checked])
-
-        selected_method_ids = set(group.method_id for group in self._selected_groups())
+        # Checkboxes are created once per group (groups are never removed), and updated in place afterwards
         for method_id, group in self._groups.items():
-            # Checkbox row of the form:
-            # [x] <method label> <num runs> <method params description>
-            checkbox = Checkbox(
-                group_badge(self._engine, group, show_runs=True, show_description=True),
-                checked=method_id in selected_method_ids,  # checked if group was already selected
-                disabled=not group.runs_done,  # disabled if no runs
-            ).onclick(handle_click_checkbox)
-            checkboxes.append(checkbox)
-            self._column_checkboxes.append(checkbox)
+            num_runs = len(group.runs_done)
+            if (entry := self._checkboxes.get(method_id)) is None:
+                # Checkbox row of the form:
+                # [x] <method label> <num runs> <method params description>
+                label = Span(group_badge(self._engine, group, show_runs=True, show_description=True))
+                checkbox = Checkbox(
+                    label,
+                    checked=method_id in self._selected_method_ids,  # checked if group was already selected
+                    disabled=num_runs == 0,  # disabled if no runs
+                )
+                checkbox.onclick(partial(self._handle_click_checkbox, method_id, checkbox))
+                self._column_checkboxes.append(checkbox)
+                self._checkboxes[method_id] = (checkbox, label, num_runs)
+                continue
+            checkbox, label, prev_num_runs = entry
+            if num_runs != prev_num_runs:
+                label.clear().append(group_badge(self._engine, group, show_runs=True, show_description=True))
+                checkbox.set_disabled(num_runs == 0)
+                self._checkboxes[method_id] = (checkbox, label, num_runs)
+
+    def _handle_click_checkbox(self, method_id: str, checkbox: Checkbox) -> None:
+        # Only the clicked checkbox can have changed
+        if checkbox.checked:
+            self._selected_method_ids.add(method_id)
+        else:
+            self._selected_method_ids.discard(method_id)
+        self._debounce_selection.trigger()
+
+    def _update_selected_groups(self) -> None:
+        self._selected_groups.set(
+            [group for group in self._groups.values() if group.method_id in self._selected_method_ids]
+        )
 
     async def _delete_selected_runs(self) -> None:
+        # Apply any checkbox clicks that are still being debounced
+        self._debounce_selection.flush()
         selected_groups = self._selected_groups()
         msg = Column(
-            Span("Are you sure you want to delete the following runs?").style({"font-weight": "bold"}),
+            Span("Are you sure you want to delete the following runs?").style(BOLD_STYLE),
             Span("This action can not be undone!"),
             Column([group_badge(self._engine, group, show_runs=True) for group in selected_groups]).style(
-                {"gap": "12px", "padding": "8px"}
+                CONFIRM_DELETE_GROUPS_STYLE
             ),
-        ).style({"gap": "12px"})
+        ).style(CONFIRM_DELETE_STYLE)
         if await confirm(msg, ok_text="Yes"):
             runs = [run for group in selected_groups for run in group.runs]
             self._engine.delete_runs(runs)
+            self._selected_method_ids.clear()
             self._selected_groups.set([])
-            self._refresh_runs()
+            # Rebuild the checkboxes, such that none of them are checked
+            self._column_checkboxes.clear()
+            self._checkboxes.clear()
+            self._runs_signature = None
+            self.refresh_runs()
 
     def _download_metrics(self) -> None:
         # Create tmp file (FIXME: clean this up)
@@ -494,9 +610,12 @@ class PageTask(Div):
         path.parent.mkdir(exist_ok=True, parents=True)
         # Construct data and write data to file
         type_metrics = self._task.type_metrics()
+        self._debounce_selection.flush()
+        groups = self._selected_groups()
+        methods = self._engine.cache.select_methods_by_id([group.method_id for group in groups])
         data = [  # TODO: try-catch
             {
-                "method": self._engine.cache.select_method(group.method_id).encode(),
+                "method": methods[group.method_id].encode(),
                 "runs": [
                     {
                         metric.name: metric.encode_value(self._engine.evaluate_metric(metric, run))
@@ -505,7 +624,7 @@ class PageTask(Div):
                     for run in group.runs_done
                 ],
             }
-            for group in self._selected_groups()
+            for group in groups
         ]
         with path.open("w") as file:
             json.dump(data, file, default=str)
@@ -514,12 +633,10 @@ class PageTask(Div):
 
 
 def create_metric_elem(engine: Engine, metric: Metric, selected_groups: Signal[list[RunGroup]]) -> Elem:
-    if isinstance(metric, Time):
-        return TimeElem(engine, metric, selected_groups)
-    if isinstance(metric, Graph):
-        return GraphElem(engine, metric, selected_groups)
-    if isinstance(metric, Table):
-        return TableElem(engine, metric, selected_groups)
+    # Look up the visualization by type, falling back to base classes for subclasses of metrics
+    for metric_type in type(metric).__mro__:
+        if (metric_elem := METRIC_ELEMS.get(metric_type)) is not None:
+            return metric_elem(engine, metric, selected_groups)
 
     msg = f"No visualization for metric of type '{type(metric)}'"
     raise NotImplementedError(msg)
@@ -533,58 +650,54 @@ class TimeElem(Panel):
         self._engine = engine
         self._time = time
         self._selected_groups = selected_groups
+        self._averages: dict[str, tuple[tuple[str, ...], dict[str, str]]] = {}
         Effect(self._setup)
 
     def _setup(self) -> None:
         groups = self._selected_groups()
 
-        # Compute data
-        keys: list[str] = []
-        data: list[dict[str, str]] = []
-
-        for group in groups:
-            # Gather `timedelta` instances
-            # Also keep track of all the keys encountered
-            timedeltas: dict[str, list[timedelta]] = defaultdict(list)
-            for run in group.runs_done:
-                for key, t in self._engine.evaluate_metric(self._time, run).items():  # FIXME: try-catch
-                    timedeltas[key].append(t)
-                    if key not in keys:
-                        keys.append(key)
-            # Compute average `timedelta` and convert to string
-            data.append(
-                {
-                    key: timedelta_to_str(sum(ts, start=timedelta(seconds=0)) / len(ts)) if len(ts) > 0 else "-"
-                    for key, ts in timedeltas.items()
-                }
-            )
+        # Hide panel if no groups are selected
+        if not groups:
+            self.clear()
+            self.style(METRIC_HIDDEN_STYLE)
+            return
 
-        # Fill any absent data
-        for datum in data:
-            for key in keys:
-                if key not in datum:
-                    datum[key] = "-"
+        # Compute data (absent data is shown as "-")
+        data = [self._group_averages(group) for group in groups]
+        keys = list(dict.fromkeys(key for datum in data for key in datum))
 
         # Create UI
         self.clear()
-        self.style({"padding": "16px", "display": "none" if len(groups) == 0 else None})
+        self.style(TIME_STYLE)
+        cells: list[Elem] = [Div(), *[Div(key).style(TIME_KEY_STYLE) for key in keys]]
+        for group, datum in zip(groups, data):
+            cells.append(group_circle(group))
+            cells.extend([Div(datum.get(key, "-")) for key in keys])
         self.append(
-            Div()
-            .style(
-                {
-                    "display": "grid",
-                    "grid-template-columns": f"repeat({1 + len(keys)}, max-content)",
-                    "grid-gap": "8px 16px",
-                    "align-items": "center",
-                    "justify-content": "space-around",
-                    "justify-items": "center",
-                }
-            )
-            .append(Div())
-            .append([Div(key).style({"font-style": "italic"}) for key in keys])
-            .append(*[[group_circle(group), *[Div(datum[key]) for key in keys]] for group, datum in zip(groups, data)])
+            Div(cells).style(TIME_GRID_STYLE).style({"grid-template-columns": f"repeat({1 + len(keys)}, max-content)"})
         )
 
+    def _group_averages(self, group: RunGroup) -> dict[str, str]:
+        # Reuse the averages of the group if its runs have not changed
+        key = tuple(run.id for run in group.runs_done)
+        if (cached := self._averages.get(group.method_id)) is not None and cached[0] == key:
+            return cached[1]
+        # Accumulate total durations as integer numbers of microseconds
+        totals: dict[str, int] = {}
+        counts: dict[str, int] = {}
+        for run in group.runs_done:
+            for name, t in self._engine.evaluate_metric(self._time, run).items():  # FIXME: try-catch
+                if name not in totals:
+                    totals[name] = counts[name] = 0
+                totals[name] += (t.days * 86_400 + t.seconds) * 1_000_000 + t.microseconds
+                counts[name] += 1
+        # Compute average durations and convert to strings
+        averages = {
+            name: timedelta_to_str(timedelta(microseconds=total / counts[name])) for name, total in totals.items()
+        }
+        self._averages[group.method_id] = (key, averages)
+        return averages
+
 
 class GraphElem(Panel):
     """Component to visualize the :py:class:`Graph` metric."""
@@ -594,12 +707,15 @@ class GraphElem(Panel):
         self._engine = engine
         self._graph = graph
         self._selected_groups = selected_groups
+        self._plots: dict[str, tuple[tuple[Any, ...], list[SlashPlot]]] = {}
+        self._plot_key: tuple[Any, ...] | None = None
+        self._buffer: np.ndarray | None = None  # reused by `_create_avg_std_graphs`
         self._setup()
         Effect(self._plot)
 
     def _setup(self) -> None:
         self.clear()
-        self.style({"display": "flex", "flex-direction": "column", "align-items": "center"})
+        self.style(GRAPH_STYLE)
 
         self._axes = Axes(width=512, height=384).set_grid(True)
         self._axes.onmount(lambda: self._axes.render())
@@ -615,41 +731,68 @@ class GraphElem(Panel):
 
         # "Show average" and "Show standard deviation"
         if self._graph.option_avg_std:
+            # Coalesce rapid clicks on the checkboxes into a single plot
+            debounce_plot = Debounce(self._plot, seconds=DEBOUNCE_SECONDS)
+
             # Create checkbox
             def on_click_checkbox_avg() -> None:
                 self._checkbox_std.set_disabled(not self._checkbox_avg.checked)
-                self._plot()
+                debounce_plot.trigger()
 
             self._checkbox_avg = Checkbox("Show average").onclick(on_click_checkbox_avg)
-            self._checkbox_std = Checkbox("Show standard deviation").onclick(self._plot).set_disabled(True)
-            self.append(Row(self._checkbox_avg, self._checkbox_std).style({"gap": "32px"}))
+            self._checkbox_std = Checkbox("Show standard deviation").onclick(debounce_plot.trigger).set_disabled(True)
+            self.append(Row(self._checkbox_avg, self._checkbox_std).style(GRAPH_OPTIONS_STYLE), debounce_plot)
 
     def _plot(self) -> None:
         groups = self._selected_groups()
-        # Hide panels if no groups are selected
-        self.style({"padding": "16px", "display": "none" if len(groups) == 0 else "flex"})
+        show_avg = self._graph.option_avg_std and self._checkbox_avg.checked
+        show_std = show_avg and self._checkbox_std.checked
+        # Nothing to do if the selected runs and the options are the same as for the previous plot
+        plot_key = (
+            show_avg,
+            show_std,
+            tuple((group.method_id, tuple(run.id for run in group.runs_done)) for group in groups),
+        )
+        if plot_key == self._plot_key:
+            return
+        self._plot_key = plot_key
+        # Hide panel if no groups are selected (the plots are replaced once groups are selected again)
+        if not groups:
+            self.style(METRIC_HIDDEN_STYLE)
+            return
+        self.style(GRAPH_SHOWN_STYLE)
         # Clear previous plots
         self._axes.clear_plots()
         # Plot each run in each group
         for group in groups:
-            # Case "[ ] Show average" is checked
-            if self._graph.option_avg_std and self._checkbox_avg.checked:
-                for plot in self._create_avg_std_graphs(group.runs_done, group.color):
-                    self._axes.add_plot(plot)
-            # Case "[ ] Show average" is not checked
-            else:
-                for run in group.runs_done:
-                    self._axes.add_plot(self._create_graph(run, group.color))
+            for plot in self._group_plots(group, show_avg, show_std):
+                self._axes.add_plot(plot)
         # Render if possible
         if self._axes.is_mounted():
             self._axes.render()
 
+    def _group_plots(self, group: RunGroup, show_avg: bool, show_std: bool) -> list[SlashPlot]:
+        # Reuse the plots of the group if neither its runs nor the options have changed
+        key = (show_avg, show_std, tuple(run.id for run in group.runs_done))
+        if (cached := self._plots.get(group.method_id)) is not None and cached[0] == key:
+            return cached[1]
+        # Case "[ ] Show average" is checked
+        if show_avg:
+            plots = self._create_avg_std_graphs(group.runs_done, group.color)
+        # Case "[ ] Show average" is not checked
+        else:
+            plots = [self._create_graph(run, group.color) for run in group.runs_done]
+        self._plots[group.method_id] = (key, plots)
+        return plots
+
     def _create_graph(self, run: Run, color: str) -> SlashPlot:
         # Evaluate run
         xs, ys = self._engine.evaluate_metric(self._graph, run)  # TODO: try-catch
         return SlashGraph(xs, ys, color=color)
 
     def _create_avg_std_graphs(self, runs: Collection[Run], color: str) -> list[SlashPlot]:
+        import numpy as np  # imported lazily, as it is only needed once a metric is shown
+
         # If there are no runs, return an empty list of plots
         if len(runs) == 0:
             return []
@@ -657,21 +800,29 @@ class GraphElem(Panel):
         xys_per_run = [self._engine.evaluate_metric(self._graph, run) for run in runs]
         # Collect the `xs` (should be the same for all runs) and the `ys`
         xs = xys_per_run[0][0]
-        yss: list[list[float]] = []
-        for other_xs, ys in xys_per_run:
-            assert other_xs == xs, "all xs must be the same for avg"
-            yss.append(ys)
+        # The `ys` are written into a buffer that is reused across plots, followed by rows for their avg and std,
+        # and for the lower and upper bounds of the std
+        num_runs, num_xs = len(xys_per_run), len(xs)
+        size = (num_runs + 4) * num_xs
+        if self._buffer is None or self._buffer.size < size:
+            self._buffer = np.empty(size, dtype=np.float64)
+        buffer = self._buffer[:size].reshape(num_runs + 4, num_xs)
+        np_yss = buffer[:num_runs]
+        ys_avg, ys_std, ys_low, ys_high = buffer[num_runs:]
+        for i, (other_xs, ys) in enumerate(xys_per_run):
+            # Skip comparing values when runs share the very same `xs` (e.g. a constant list)
+            assert other_xs is xs or other_xs == xs, "all xs must be the same for avg"
+            np_yss[i] = ys
         # Create plot of the average of the `ys`
         plots: list[SlashPlot] = []
-        np_yss = np.array(yss)
-        ys_avg = [float(y_avg) for y_avg in np_yss.mean(axis=0)]
-        plots.append(SlashGraph(xs, ys_avg, color=color))
+        np_yss.mean(axis=0, out=ys_avg)
+        plots.append(SlashGraph(xs, ys_avg.tolist(), color=color))
         # Create a plot of the standard deviation of the `ys`
         if self._checkbox_std.checked:
-            ys_std = [float(y_std) for y_std in np_yss.std(axis=0)]
-            ys_low = [float(y - std) for y, std in zip(ys_avg, ys_std)]
-            ys_high = [float(y + std) for y, std in zip(ys_avg, ys_std)]
-            plots.append(SlashFillBetween(xs, ys_low, ys_high, color=color, opacity=0.2))
+            np_yss.std(axis=0, out=ys_std)
+            np.subtract(ys_avg, ys_std, out=ys_low)
+            np.add(ys_avg, ys_std, out=ys_high)
+            plots.append(SlashFillBetween(xs, ys_low.tolist(), ys_high.tolist(), color=color, opacity=0.2))
         return plots
 
 
@@ -688,23 +839,28 @@ class TableElem(Div):
     def _setup(self) -> None:
         groups = self._selected_groups()
 
-        # Create UI
+        # Hide table if no groups are selected
         self.clear()
-        self.style({"display": "none" if len(groups) == 0 else None})
+        if not groups:
+            self.style({"display": "none"})
+            return
+
+        # Create UI
+        self.style({"display": None})
         self.append(self._data_table_transposed(groups) if self._table.transposed else self._data_table(groups))
 
     def _data_table(self, groups: list[RunGroup]) -> SlashDataTable:
-        keys: list[str] = [self._table.first_column_label]
+        first_column_label = self._table.first_column_label
+        keys: dict[str, None] = {first_column_label: None}  # ordered set of keys
         data: list[dict[str, Any]] = []
         for group in groups:
             for run in group.runs_done:
-                datum = self._engine.evaluate_metric(self._table, run)
-                datum[self._table.first_column_label] = group_badge(self._engine, group)
-                for key in datum:
-                    if key not in keys:
-                        keys.append(key)
+                # Copy the metric value, as it is cached by the engine
+                datum = dict(self._engine.evaluate_metric(self._table, run))
+                datum[first_column_label] = group_badge(self._engine, group)
+                keys.update(dict.fromkeys(datum))
                 data.append(datum)
-        return SlashDataTable(keys).set_data(data)
+        return SlashDataTable(list(keys)).set_data(data)
 
     def _data_table_transposed(self, groups: list[RunGroup]) -> SlashDataTable:
         keys: list[str] = [self._table.first_column_label]  # + [...]
@@ -714,7 +870,7 @@ class TableElem(Div):
             for run in group.runs_done:
                 method_key = str(len(keys))  # unique ID in case multiple method labels coincide
                 keys.append(method_key)
-                labels[method_key] = group_badge(self._engine, group).style({"border": "1px solid #0005"})
+                labels[method_key] = group_badge(self._engine, group).style(TABLE_BADGE_STYLE)
                 datum = self._engine.evaluate_metric(self._table, run)
                 for key, value in datum.items():
                     if key not in data:
@@ -723,6 +879,14 @@ class TableElem(Div):
         return SlashDataTable(keys, labels=labels).set_data(list(data.values()))
 
 
+# Visualization component for each type of metric
+METRIC_ELEMS: dict[type[Metric], Callable[[Engine, Any, Signal[list[RunGroup]]], Elem]] = {
+    Time: TimeElem,
+    Graph: GraphElem,
+    Table: TableElem,
+}
+
+
 class DialogNewRun(Dialog):
     def __init__(self, engine: Engine, task: Task) -> None:
         super().__init__()
@@ -750,7 +914,7 @@ class DialogNewRun(Dialog):
             Row(
                 button_start := Button("Start").onclick(self._handle_click_start).set_disabled(True),
                 Button("Cancel").onclick(lambda: self.close()),
-            ).style({"justify-content": "center", "gap": "16px", "margin-top": "16px"}),
+            ).style(DIALOG_BUTTONS_STYLE),
         )
         self._select_method = select_method
         self._input_num_runs = input_num_runs
@@ -761,9 +925,7 @@ class DialogNewRun(Dialog):
         method_params = self._method_types[self._select_method.value].type_params()
         self._form_wrapper.clear()
         if method_params:
-            self._form_wrapper.append(
-                Div().style({"background-color": "var(--border-muted)", "height": "1px", "margin": "16px 0px"})
-            )
+            self._form_wrapper.append(Div().style(DIALOG_SEPARATOR_STYLE))
         self._form = Form(method_params)
         self._form_wrapper.append(self._form)
         self._button_start.set_disabled(False)
@@ -789,14 +951,19 @@ class DialogNewRun(Dialog):
         self._engine.execute_run_in_process(self._task, method, num_runs=num_runs)
 
 
-class Form(Div):
-    INPUT_TYPE: dict[type[int | float | str], str] = {
-        bool: "number",
-        int: "number",
-        float: "number",
-        str: "text",
-    }
+INPUT_TYPE: dict[type[int | float | str], str] = {
+    bool: "number",
+    int: "number",
+    float: "number",
+    str: "text",
+}
+INPUT_COERCION: dict[type[int | float | str], Callable[[str], int | float | str]] = {
+    int: int,
+    float: float,
+}
 
+
+class Form(Div):
     def __init__(self, params: Collection[Param]) -> None:
         super().__init__()
         self._params = tuple(params)
@@ -805,16 +972,18 @@ class Form(Div):
     def _setup(self) -> None:
         # Create inputs
         self._inputs = {param.name: self._create_input(param) for param in self._params}
+        # Resolve how to convert the value of each input once, rather than on every call to `value`
+        self._coercions = {param.name: INPUT_COERCION.get(param.type, str) for param in self._params}
         # Create grid of inputs
         self.append(div := Div().style(FORM_STYLE))
         for param in self._params:
             # Each parameter has a row with name and input
-            label = Row(Span(param.name)).style({"align-items": "center", "gap": "4px"})
+            label = Row(Span(param.name)).style(FORM_LABEL_STYLE)
             div.append(label, self._inputs[param.name])
             # If `param` has description, add help icon with tooltip
             if param.description is not None:
                 label.append(
-                    icon := Icon("help").style({"color": "var(--gray)", "--icon-size": "20px"}),
+                    icon := Icon("help").style(FORM_HELP_ICON_STYLE),
                     Tooltip(param.description, target=icon),
                 )
 
@@ -828,44 +997,31 @@ class Form(Div):
         # If no options are given, use an `Input` element
         else:
             input = Input()
-            input.type = Form.INPUT_TYPE.get(param.type, "text")
+            input.type = INPUT_TYPE.get(param.type, "text")
             if param.default is not None:
                 input.value = str(param.default)
             return input
 
     def value(self, param: Param) -> int | float | str:
-        value = self._inputs[param.name].value
-        if param.type is int:
-            return int(value)
-        if param.type is float:
-            return float(value)
-        return str(value)
+        return self._coercions[param.name](self._inputs[param.name].value)
 
 
 def action_button(*children: Children) -> Button:
-    return Button(*children).style(
-        {
-            "min-width": "inherit",
-            "width": "36px",
-            "height": "36px",
-            "padding": "0px",
-            "display": "flex",
-            "justify-content": "center",
-            "align-items": "center",
-        }
-    )
+    return Button(*children).style(ACTION_BUTTON_STYLE)
 
 
 def group_circle(group: RunGroup) -> Div:
-    return Div().style({"width": "24px", "height": "24px", "border-radius": "12px", "background-color": group.color})
+    return Div().style(GROUP_CIRCLE_STYLE).style({"background-color": group.color})
 
 
 def group_badge(engine: Engine, group: RunGroup, *, show_runs: bool = False, show_description: bool = False) -> Span:
     try:
         method = engine.cache.select_method(group.method_id)
         method_label = method.label()
-        method_params_description = ", ".join(
-            [f"{param.name} = {getattr(method, param.name, '?')}" for param in method.type_params()]
+        method_params_description = (
+            ", ".join([f"{param.name} = {getattr(method, param.name, '?')}" for param in method.type_params()])
+            if show_description
+            else ""
         )
     except Exception as err:
         Session.require().log(
@@ -877,22 +1033,13 @@ def group_badge(engine: Engine, group: RunGroup, *, show_runs: bool = False, sho
         method_params_description = ""
 
     spans: list[Span] = []
-    spans.append(
-        Span(method_label).style(
-            {
-                "background-color": group.color,
-                "color": "var(--white)",
-                "padding": "3px 6px",
-                "border-radius": "4px",
-            }
-        )
-    )
+    spans.append(Span(method_label).style(GROUP_LABEL_STYLE).style({"background-color": group.color}))
 
     if show_runs:
-        spans.append(Span(f" ({len(group.runs_done)} runs)").style({"color": "var(--gray)"}))
+        spans.append(Span(f" ({len(group.runs_done)} runs)").style(GROUP_RUNS_STYLE))
 
     if show_description:
-        spans.append(Span(" " + method_params_description).style({"color": "var(--gray)", "font-size": "12px"}))
+        spans.append(Span(" " + method_params_description).style(GROUP_DESCRIPTION_STYLE))
 
     if len(spans) == 1:
         return spans[0]
@@ -1,6 +1,8 @@
-from collections.abc import Callable, Collection
-from dataclasses import dataclass
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from slash.core import Elem, Session
@@ -8,27 +10,31 @@ from slash.events import ClickEvent, SupportsOnClick
 from slash.js import JSFunction
 
 from bench._components import Run
+from bench._logging import get_logger
 
+_LOGGER = get_logger("bench")
 
+
+@lru_cache(maxsize=4096)
 def timedelta_to_str(t: timedelta) -> str:
     """Format timedelta into read-friendly format."""
-    seconds = t.total_seconds()
-    if seconds < 1e-3:
-        microseconds = round(seconds * 1e6)
+    # Work with the exact integer number of microseconds, rather than a float number of seconds
+    microseconds = (t.days * 86_400 + t.seconds) * 1_000_000 + t.microseconds
+    if microseconds < 1_000:
         return f"{microseconds} µs"
-    elif seconds < 1:
-        milliseconds = round(seconds * 1e3)
+    elif microseconds < 1_000_000:
+        milliseconds = round(microseconds / 1_000)
         return f"{milliseconds} ms"
-    elif seconds < 60:
-        return f"{seconds:.1f} sec"
-    elif seconds < 60 * 60:
-        seconds = round(seconds)
+    elif microseconds < 60_000_000:
+        return f"{microseconds / 1_000_000:.1f} sec"
+    elif microseconds < 3_600_000_000:
+        seconds = round(microseconds / 1_000_000)
         return f"{seconds // 60} min {seconds % 60} sec"
-    elif seconds < 60 * 60 * 24:
-        minutes = round(seconds / 60)
+    elif microseconds < 86_400_000_000:
+        minutes = round(microseconds / 60_000_000)
         return f"{minutes // 60} hrs {minutes % 60} min"
     else:
-        hours = round(seconds / 60 / 60)
+        hours = round(microseconds / 3_600_000_000)
         return f"{hours // 24} days {hours % 24} hrs"
 
 
@@ -62,20 +68,98 @@ class Timer(Elem, SupportsOnClick):
         Session.require().execute(_JS_TIMER, [self.id, self._seconds * 1000.0])
 
     def _handle_click(self, event: ClickEvent) -> None:
-        self._callback()
-        if self._repeat:
-            self._start_timer()
+        try:
+            self._callback()
+        finally:
+            # Keep repeating, also if the callback failed
+            if self._repeat:
+                self._start_timer()
+
+
+class Ticker(Timer):
+    """Invisible element that repeatedly calls all subscribed callbacks.
+
+    This allows several components to poll at the same interval using a single timer.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self._callbacks: list[Callable[[], None]] = []
+        super().__init__(self._tick, seconds, repeat=True)
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[], None]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _tick(self) -> None:
+        # Iterate over a copy, as callbacks may unsubscribe themselves
+        for callback in list(self._callbacks):
+            # A failing callback must not prevent the other callbacks from being called
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Ticker callback failed due to the following exception:")
+
+
+class Debounce(Elem, SupportsOnClick):
+    """Invisible element that calls a callback once it has not been triggered for some time.
+
+    This coalesces bursts of triggers (e.g. rapid clicks) into a single call of the callback.
+    Whether to call the callback is decided by the time of the last trigger, not by counting timers,
+    as the timer of an element that is not in the document (e.g. on a page that is not shown) is lost.
+    """
+
+    def __init__(self, callback: Callable[[], None], seconds: float) -> None:
+        super().__init__("div")
+
+        self._callback = callback
+        self._seconds = seconds
+        self._pending = False
+        self._last_trigger = 0.0
+
+        self.style({"display": "none"})
+        self.onclick(self._handle_click)
+        # Re-arm the timer when shown again, in case it was lost while not in the document
+        self.onmount(self._rearm)
+
+    def trigger(self) -> None:
+        self._pending = True
+        self._last_trigger = time.monotonic()
+        self._start_timer(self._seconds)
+
+    def flush(self) -> None:
+        """Call the callback right away if a call is pending."""
+        if self._pending:
+            self._pending = False
+            self._callback()
+
+    def _rearm(self) -> None:
+        self._start_timer(self._seconds)
+
+    def _start_timer(self, seconds: float) -> None:
+        if self._pending:
+            Session.require().execute(_JS_TIMER, [self.id, seconds * 1000.0])
+
+    def _handle_click(self, event: ClickEvent) -> None:
+        if not self._pending:
+            return
+        remaining = self._seconds - (time.monotonic() - self._last_trigger)
+        if remaining > 0.0:
+            # Triggered again since this timer was started (or the timer fired early), so wait for the remainder
+            self._start_timer(remaining)
+            return
+        self.flush()
 
 
-@dataclass
+@dataclass(slots=True)
 class RunGroup:
     method_id: str
     color: str
     runs: list[Run]
-
-    @property
-    def runs_done(self) -> Collection[Run]:
-        return tuple(run for run in self.runs if run.status == "done")
+    runs_done: list[Run] = field(default_factory=list)  # subset of `runs` with status "done"
 
 
 COLORS = [
@@ -90,10 +174,11 @@ COLORS = [
     "var(--pink)",
     "var(--aubergine)",
 ]
+_NUM_COLORS = len(COLORS)
 
 
 def get_color(index: int) -> str:
-    return COLORS[index % len(COLORS)]
+    return COLORS[index % _NUM_COLORS]
 
 
 _JS_DOWNLOAD_FILE = JSFunction(
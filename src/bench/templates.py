@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import cache
 from typing import Annotated, Any, Generic, Literal, Self, TypeVar, get_args, get_origin, get_type_hints
 
 from bench._utils import TypedFunction
@@ -60,6 +61,17 @@ class Param(Generic[P]):
 
 def _params_default(constructor: Callable[..., Any]) -> list[Param]:
     """Default implementation of `.params()` of `Task` and `Method` using type hints."""
+    # Return a new list, such that callers cannot modify the cached parameters
+    return list(_params_from_signature(constructor))
+
+
+@cache
+def _params_from_signature(constructor: Callable[..., Any]) -> tuple[Param, ...]:
+    """Parameters of the given constructor, derived from its signature and type hints.
+
+    The result is cached, as inspecting signatures and resolving type hints is relatively expensive,
+    and the parameters are requested for every form and method label in the dashboard.
+    """
     params: list[Param] = []
     signature = inspect.signature(constructor)
     type_hints = get_type_hints(constructor)
@@ -85,7 +97,7 @@ def _params_default(constructor: Callable[..., Any]) -> list[Param]:
                 description = str(annotation_args[1])
         # Create `Param` from obtained information
         params.append(Param(name=name, type=type_hint, options=options, default=default, description=description))
-    return params
+    return tuple(params)
 
 
 class Task(ABC, Serializable):
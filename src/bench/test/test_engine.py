@@ -6,7 +6,8 @@ from typing import Any, cast
 import pytest
 
 import bench.test.main as main
-from bench._engine import Engine
+from bench._components import to_hash
+from bench._engine import Engine, load_bench
 from bench.templates import Param
 
 
@@ -21,6 +22,12 @@ def test_engine_loads_bench(engine: Engine) -> None:
     """Check that engine can be created from file without errors."""
 
 
+def test_load_bench_is_cached() -> None:
+    """Check that loading the same unmodified module twice returns the same bench."""
+    path = Path(cast(str, main.__file__))
+    assert load_bench(path) is load_bench(path)
+
+
 def test_engine_create_task(engine: Engine) -> None:
     """Check that engine can instantiate all types of tasks."""
     for task_type in engine.bench.task_types:
@@ -46,6 +53,70 @@ def test_engine_execute_run(engine: Engine) -> None:
             engine.execute_run(task, method)
 
 
+def test_cache_select_methods_by_id(engine: Engine) -> None:
+    """Check that methods can be selected in bulk by their IDs."""
+    methods = []
+    for method_type in engine.bench.method_types:
+        args = _create_random_arguments(method_type.type_params())
+        methods.append(engine.create_method(method_type, **args))
+    method_ids = [to_hash(method) for method in methods]
+    # Use a new engine, such that the methods are read from the database
+    other_engine = Engine(Path(cast(str, main.__file__)))
+    selected = other_engine.cache.select_methods_by_id([*method_ids, "unknown"])
+    assert set(selected) == set(method_ids)
+    for method in methods:
+        assert selected[to_hash(method)].encode() == method.encode()
+
+
+def test_cache_select_task_ids(engine: Engine) -> None:
+    """Check that the task IDs match the IDs of the selected tasks."""
+    for task_type in engine.bench.task_types:
+        engine.create_task(task_type, **_create_random_arguments(task_type.type_params()))
+    task_ids = engine.cache.select_task_ids()
+    assert task_ids == {to_hash(task) for task in engine.cache.select_tasks()}
+
+
+def test_cache_transaction(engine: Engine) -> None:
+    """Check that changes made inside a transaction are only committed once it exits, and not if it fails."""
+    # Use a second engine, which has its own connection to the database
+    other_engine = Engine(Path(cast(str, main.__file__)))
+
+    task = main.TaskAdd(x=secrets.randbits(32), y=secrets.randbits(32))
+    with engine.cache.transaction():
+        engine.cache.insert_task(task)
+        assert to_hash(task) not in other_engine.cache.select_task_ids()
+    assert to_hash(task) in other_engine.cache.select_task_ids()
+
+    task = main.TaskAdd(x=secrets.randbits(32), y=secrets.randbits(32))
+    with pytest.raises(RuntimeError):
+        with engine.cache.transaction():
+            engine.cache.insert_task(task)
+            with engine.cache.transaction():  # nested transactions are rolled back by the outermost one
+                engine.cache.insert_task(task)
+            raise RuntimeError
+    assert to_hash(task) not in engine.cache.select_task_ids()
+    assert to_hash(task) not in other_engine.cache.select_task_ids()
+    # The task is also no longer cached in memory
+    with pytest.raises(ValueError):
+        engine.cache.select_task(to_hash(task))
+
+
+def test_engine_evaluate_metric_is_cached(engine: Engine) -> None:
+    """Check that metrics are evaluated once per run, and re-evaluated when the result changes."""
+    for task_type in engine.bench.task_types:
+        args = _create_random_arguments(task_type.type_params())
+        task = engine.create_task(task_type, **args)
+        method_type = next(iter(engine.bench.method_types))
+        method = engine.create_method(method_type, **_create_random_arguments(method_type.type_params()))
+        run = engine.execute_run(task, method)
+        for metric in task_type.type_metrics():
+            value = engine.evaluate_metric(metric, run)
+            assert run.metrics[metric.name] is value
+            assert engine.evaluate_metric(metric, run) is value
+        run.result = run.result
+        assert not run.metrics
+
+
 def _create_random_arguments(params: list[Param]) -> dict[str, Any]:
     values: dict[str, Any] = {}
     for param in params:
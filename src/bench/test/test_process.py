@@ -0,0 +1,38 @@
+import sys
+import time
+from pathlib import Path
+
+from bench._process import Process
+
+# Writes a multi-byte character split across two writes, and some output right before exiting
+SCRIPT = """
+import sys, time
+out = sys.stdout.buffer
+out.write(b"start\\n"); out.flush(); time.sleep(0.2)
+out.write("é".encode()[:1]); out.flush(); time.sleep(0.2)
+out.write("é".encode()[1:] + b" middle\\n"); out.flush(); time.sleep(0.2)
+out.write(b"end")
+"""
+
+
+def test_process_read_stdout(tmp_path: Path) -> None:
+    """Check that reading stdout incrementally across polls yields the full output of the process."""
+    process = Process([sys.executable, "-c", SCRIPT], path_stdout=tmp_path / "stdout")
+    chunks: list[str] = []
+    offset = 0
+    deadline = time.monotonic() + 10.0
+    while True:
+        status = process.poll()
+        chunk = process.read_stdout(offset)
+        offset += len(chunk)
+        chunks.append(chunk)
+        if status is not None:
+            break
+        assert time.monotonic() < deadline, "process did not exit in time"
+        time.sleep(0.02)
+
+    assert status == 0
+    assert "".join(chunks) == process.stdout == "start\né middle\nend"
+    # Nothing is read after the process exited
+    assert process.poll() == 0
+    assert process.read_stdout(offset) == ""